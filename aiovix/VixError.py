@@ -1,7 +1,27 @@
+import functools
+
 from aiovix import _backend, API_ENCODING
 vix = _backend._vix
 ffi = _backend._ffi
 
+
+@functools.lru_cache(maxsize=None)
+def _error_text(error_code):
+    """Gets the text VIX has for an error code, the text never changes so it's looked up once per code.
+
+    .. note:: Internal use.
+    """
+
+    return str(
+        ffi.string(
+            vix.Vix_GetErrorText(
+                ffi.cast('VixError', error_code),
+                ffi.NULL
+            )
+        ),
+    API_ENCODING
+    )
+
 class VixError(Exception):
     VIX_OK = 0
 
@@ -316,6 +336,17 @@ class VixError(Exception):
     def __init__(self, error_code):
         self._error = error_code
 
+    @property
+    def error_code(self):
+        """The error's code, comparable to VixError.VIX_E_*.
+
+        Like VIX's VIX_ERROR_CODE macro, the extra information VIX keeps in the upper bits is dropped.
+
+        :rtype: int
+        """
+
+        return self._error & 0xFFFF
+
     def _str__(self):
         return "VixError #{0}: {1}".format(str(self._error), self.get_error_text() or "?")
 
@@ -326,12 +357,4 @@ class VixError(Exception):
         :rtype: str
         """
 
-        return str(
-            ffi.string(
-                vix.Vix_GetErrorText(
-                    ffi.cast('VixError', self._error), 
-                    ffi.cast('char*', 0)
-                )
-            ), 
-        API_ENCODING
-        )
+        return _error_text(self._error)
@@ -1,7 +1,36 @@
+import threading
+
 from aiovix import _backend, VixError, API_ENCODING
 vix = _backend._vix
 ffi = _backend._ffi
 
+# A property id always has the same type, whatever handle it is read from.
+_property_types = dict()
+
+
+def _release_handle(handle):
+    """Releases a VIX handle, used as the finalizer of wrappers that own their handle.
+
+    .. note:: Internal use.
+    """
+
+    vix.Vix_ReleaseHandle(handle)
+
+
+class _Scratch(threading.local):
+    """Per-thread out-parameters, reused by VIX calls instead of allocated on every call.
+
+    Each keyword names an attribute and the cffi type it is allocated as. Callers
+    read the value out before returning, so a buffer is never shared between two
+    pending calls on the same thread.
+
+    .. note:: Internal use.
+    """
+
+    def __init__(self, **ctypes):
+        for name, ctype in ctypes.items():
+            setattr(self, name, ffi.new(ctype))
+
 
 class VixHandle(object):
     """Represents a handle of the VIX library.
@@ -9,6 +38,8 @@ class VixHandle(object):
     .. note:: Internal use.
     """
 
+    __slots__ = ('_handle', )
+
     VIX_INVALID_HANDLE = 0
 
     VIX_HANDLETYPE_NONE = 0
@@ -84,6 +115,13 @@ class VixHandle(object):
 
         vix.Vix_ReleaseHandle(self._handle)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        self._handle = self.VIX_INVALID_HANDLE
+
     def get_properties(self, *args):
         c_args = list()
         ret_vals = list()
@@ -118,6 +156,7 @@ class VixHandle(object):
                 results.append(int(val[0]))
             elif val_type == self.VIX_PROPERTYTYPESTRING:
                 results.append(str(ffi.string(val[0]), API_ENCODING))
+                vix.Vix_FreeBuffer(val[0])
             elif val_type == self.VIX_PROPERTYTYPE_BOOL:
                 results.append(bool(val[0]))
             else:
@@ -127,6 +166,11 @@ class VixHandle(object):
 
 
     def get_property_type(self, property_id):
+        try:
+            return _property_types[property_id]
+        except KeyError:
+            pass
+
         prop_type = ffi.new('VixPropertyType*')
         error_code = vix.Vix_GetPropertyType(
             self._handle,
@@ -137,4 +181,5 @@ class VixHandle(object):
         if error_code != VixError.VIX_OK:
             raise VixError(error_code)
 
-        return int(prop_type[0])
+        prop_type = _property_types[property_id] = int(prop_type[0])
+        return prop_type
@@ -123,14 +123,14 @@ class VixHost(object):
         job = vix.VixHost_Connect(
             self._VIX_API_VERSION,
             service_provider,
-            ffi.from_buffer(bytes(host[0], API_ENCODING)) if host[0] else ffi.cast('const char*', 0),
+            ffi.from_buffer(bytes(host[0], API_ENCODING)) if host[0] else ffi.NULL,
             host[1],
-            ffi.from_buffer(bytes(credentials[0], API_ENCODING)) if credentials[0] is not None else ffi.cast('const char*', 0),
-            ffi.from_buffer(bytes(credentials[1], API_ENCODING)) if credentials[1] is not None else ffi.cast('const char*', 0),
+            ffi.from_buffer(bytes(credentials[0], API_ENCODING)) if credentials[0] is not None else ffi.NULL,
+            ffi.from_buffer(bytes(credentials[1], API_ENCODING)) if credentials[1] is not None else ffi.NULL,
             0,
             0,
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            ffi.NULL,
+            ffi.NULL,
         )
 
         if VixHandle(job).get_type() != VixHandle.VIX_HANDLETYPE_JOB:
@@ -167,8 +167,8 @@ class VixHost(object):
         job = VixJob(vix.VixHost_RegisterVM(
             self._handle,
             ffi.cast('const char*', bytes(vmx_path, API_ENCODING)),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            ffi.NULL,
+            ffi.NULL,
         ))
         error_code = job.wait()
         if error_code != VixError.VIX_OK:
@@ -187,8 +187,8 @@ class VixHost(object):
         job = VixJob(vix.VixHost_UnregisterVM(
             self._handle,
             ffi.cast('const char*', bytes(vmx_path, API_ENCODING)),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            ffi.NULL,
+            ffi.NULL,
         ))
         error_code = job.wait()
         if error_code != VixError.VIX_OK:
@@ -211,8 +211,8 @@ class VixHost(object):
             ffi.new('char[]', bytes(vmx_path, API_ENCODING)),
             ffi.cast('VixVMOpenOptions', 0),
             ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            ffi.NULL,
+            ffi.NULL,
         ))
 
         return VixVM(job.wait(VixJob.VIX_PROPERTY_JOB_RESULT_HANDLE))
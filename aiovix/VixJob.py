@@ -248,5 +248,19 @@ class VixJob(VixHandle):
 
         return result
 
+    def get_property_single(self, *args):
+        """Get properties of a job that has a single result set.
+
+        :param args: properties to fetch.
+
+        :returns: A tuple of the requested properties.
+        :rtype: tuple
+
+        :raises vix.VixError: On failure to fetch results.
+        """
+
+        return self._get_nth_properties(0, *args)
+
     def __del__(self):
-        self.release()
+        if self.is_valid():
+            self.release()
@@ -1,17 +1,103 @@
-from .VixHandle import VixHandle
+import asyncio
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .VixHandle import VixHandle, _release_handle, _Scratch
 from .VixError import VixError
-from aiovix import _backend
+from aiovix import _backend, API_ENCODING
 vix = _backend._vix
 ffi = _backend._ffi
 
+_ffi_new = ffi.new
+
+# Bound once to skip the library lookup per call, the library isn't loaded for documentation builds.
+if vix is not None:
+    _GetNumChildren = vix.VixSnapshot_GetNumChildren
+    _GetChild = vix.VixSnapshot_GetChild
+    _GetParent = vix.VixSnapshot_GetParent
+    _GetProperties = vix.Vix_GetProperties
+    _FreeBuffer = vix.Vix_FreeBuffer
+
+_VIX_OK = VixError.VIX_OK
+
+
+_scratch = _Scratch(count='int*', handle='VixHandle*')
+
+# Caps the snapshot calls running in worker threads at once, per event loop.
+_MAX_CONCURRENT_CALLS = 8
+_loop_semaphores = weakref.WeakKeyDictionary()
+
+
+async def _to_thread(func, *args):
+    """Runs a blocking snapshot call in a worker thread.
+
+    Only VIX calls that have no completion callback go through here, VIX jobs
+    complete through their callback and don't take a thread while they run.
+
+    .. note:: Internal use.
+    """
+
+    loop = asyncio.get_running_loop()
+    semaphore = _loop_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _loop_semaphores[loop] = asyncio.Semaphore(_MAX_CONCURRENT_CALLS)
+
+    async with semaphore:
+        return await asyncio.to_thread(func, *args)
+
+
+def _take_string(ptr):
+    """Decodes a string returned by VIX and frees its buffer.
+
+    .. note:: Internal use.
+    """
+
+    if ptr == ffi.NULL:
+        return ''
+
+    value = str(ffi.string(ptr), API_ENCODING)
+    _FreeBuffer(ptr)
+    return value
+
 
 class VixSnapshot(VixHandle):
-    """Represents a VM's snapshot"""
+    """Represents a VM's snapshot
+
+    .. note:: The name, description and power state are cached per instance,
+        call :meth:`refresh` to read them again. Tree lookups always query VIX.
+
+    .. note:: Every lookup returns a new snapshot object that owns its handle. The handle
+        is released by :meth:`release`, at the end of a ``with`` block or when the object is collected.
+    """
+
+    __slots__ = ('_name', '_description', '_power_state', '_finalizer', '__weakref__', )
 
     def __init__(self, handle):
         super(VixSnapshot, self).__init__(handle)
         assert self.get_type() == VixHandle.VIX_HANDLETYPE_SNAPSHOT, 'Expected VixSnapshot handle.'
 
+        self._finalizer = weakref.finalize(self, _release_handle, self._handle)
+        self._reset_cache()
+
+    @classmethod
+    def _from_trusted(cls, handle):
+        """Wraps a handle that VIX returned as a snapshot, skipping the handle type check.
+
+        .. note:: Internal use.
+        """
+
+        snapshot = cls.__new__(cls)
+        snapshot._handle = handle
+        snapshot._finalizer = weakref.finalize(snapshot, _release_handle, handle)
+        snapshot._reset_cache()
+        return snapshot
+
+    def _reset_cache(self):
+        self._name = None
+        self._description = None
+        self._power_state = None
+
     @property
     def name(self):
         """Gets the snapshot's name.
@@ -19,7 +105,9 @@ class VixSnapshot(VixHandle):
         :rtype: str
         """
 
-        return self.get_properties(VixHandle.VIX_PROPERTY_SNAPSHOT_DISPLAYNAME)
+        if self._name is None:
+            self._fetch_meta()
+        return self._name
 
     @property
     def description(self):
@@ -27,7 +115,10 @@ class VixSnapshot(VixHandle):
 
         :rtype: str
         """
-        return self.get_properties(VixHandle.VIX_PROPERTY_SNAPSHOT_DESCRIPTION)
+
+        if self._description is None:
+            self._fetch_meta()
+        return self._description
     
     @property
     def power_state(self):
@@ -37,7 +128,37 @@ class VixSnapshot(VixHandle):
         :rtype: int
         """
 
-        return self.get_properties(VixHandle.VIX_PROPERTY_SNAPSHOT_POWERSTATE)
+        if self._power_state is None:
+            self._fetch_meta()
+        return self._power_state
+
+    def _fetch_meta(self):
+        """Fetches the name, description and power state in a single call.
+
+        :raises vix.VixError: On failure to get properties.
+        """
+
+        name = _ffi_new('char**')
+        description = _ffi_new('char**')
+        power_state = _ffi_new('int*')
+
+        error_code = _GetProperties(
+            self._handle,
+            ffi.cast('VixPropertyID', VixHandle.VIX_PROPERTY_SNAPSHOT_DISPLAYNAME),
+            name,
+            ffi.cast('VixPropertyID', VixHandle.VIX_PROPERTY_SNAPSHOT_DESCRIPTION),
+            description,
+            ffi.cast('VixPropertyID', VixHandle.VIX_PROPERTY_SNAPSHOT_POWERSTATE),
+            power_state,
+            ffi.cast('VixPropertyID', VixHandle.VIX_PROPERTY_NONE),
+        )
+
+        if error_code != _VIX_OK:
+            raise VixError(error_code)
+
+        self._name = _take_string(name[0])
+        self._description = _take_string(description[0])
+        self._power_state = int(power_state[0])
 
     def get_num_children(self):
         """Gets the number of children the current snapshot has.
@@ -45,13 +166,13 @@ class VixSnapshot(VixHandle):
         :raises vix.VixError: On failure to get child count.
         """
 
-        child_count = ffi.new('int*')
-        error_code = vix.VixSnapshot_GetNumChildren(
+        child_count = _scratch.count
+        error_code = _GetNumChildren(
             self._handle,
             child_count,
         )
 
-        if error_code != VixError.VIX_OK:
+        if error_code != _VIX_OK:
             raise VixError(error_code)
 
         return int(child_count[0])
@@ -67,17 +188,17 @@ class VixSnapshot(VixHandle):
         :raises vix.VixError: On failure to retrieve snapshot.
         """
 
-        child_handle = ffi.new('VixHandle*')
-        error_code = vix.VixSnapshot_GetChild(
+        child_handle = _scratch.handle
+        error_code = _GetChild(
             self._handle,
             child_index,
             child_handle,
         )
 
-        if error_code != VixError.VIX_OK:
+        if error_code != _VIX_OK:
             raise VixError(error_code)
 
-        return VixSnapshot(child_handle[0])
+        return VixSnapshot._from_trusted(int(child_handle[0]))
 
     def get_parent(self):
         """Gets the parent of the current snapshot.
@@ -87,19 +208,260 @@ class VixSnapshot(VixHandle):
 
         :raises vix.VixError: On failure to get snapshot.
         """
-        
-        parent_handle = ffi.new('VixHandle*')
-        error_code = vix.VixSnapshot_GetParent(
+
+        parent_handle = _scratch.handle
+        error_code = _GetParent(
             self._handle,
             parent_handle,
         )
 
-        if error_code != VixError.VIX_OK:
+        if error_code != _VIX_OK:
             raise VixError(error_code)
 
-        temp_handle = VixHandle(parent_handle[0])
-        if temp_handle.get_type() == VixHandle.VIX_HANDLETYPE_NONE:
-            temp_handle.release()
+        # Root snapshots have no parent, VIX returns an invalid handle for them.
+        handle = int(parent_handle[0])
+        if handle == VixHandle.VIX_INVALID_HANDLE:
             return None
+        return VixSnapshot._from_trusted(handle)
+
+    def refresh(self):
+        """Drops the cached name, description and power state of the current snapshot."""
+
+        self._reset_cache()
+
+    def release(self):
+        """Releases the snapshot handle, subsequent calls do nothing."""
+
+        self._finalizer()
+
+    def get_children(self):
+        """Gets all children of the current snapshot.
+
+        :returns: List of child snapshots.
+        :rtype: list
+
+        :raises vix.VixError: On failure to retrieve child snapshots.
+        """
+
+        count = self.get_num_children()
+
+        handle = self._handle
+        child_handle = _scratch.handle
+        children = list()
+        for i in range(count):
+            error_code = _GetChild(handle, i, child_handle)
+            if error_code != _VIX_OK:
+                raise VixError(error_code)
+
+            children.append(VixSnapshot._from_trusted(int(child_handle[0])))
+
+        return children
+
+    def walk(self, breadth_first=False):
+        """Iterates over the current snapshot and all of its descendants.
+
+        :param bool breadth_first: True to visit the tree level by level, otherwise depth first.
+
+        :returns: A generator yielding this snapshot followed by its descendants.
+
+        :raises vix.VixError: On failure to enumerate child snapshots.
+        """
+
+        pending = deque([self])
+        pop = pending.popleft if breadth_first else pending.pop
+
+        while pending:
+            snapshot = pop()
+            yield snapshot
+
+            children = snapshot.get_children()
+            # Pushed in reverse so a depth first walk visits the children in order.
+            pending.extend(children if breadth_first else reversed(children))
+
+    def prefetch_all(self, max_workers=8):
+        """Fetches the name, description and power state of the current snapshot and all of its descendants.
+
+        The properties are fetched concurrently and cached on the returned snapshots, reading them doesn't call VIX.
+
+        :param int max_workers: Maximum number of threads fetching properties.
+
+        :returns: This snapshot followed by its descendants, depth first.
+        :rtype: list
+
+        :raises vix.VixError: On failure to read the snapshot tree or its properties.
+        """
+
+        snapshots = list(self.walk())
+        pending = [snapshot for snapshot in snapshots if snapshot._name is None]
+        if pending:
+            with ThreadPoolExecutor(max_workers) as executor:
+                list(executor.map(VixSnapshot._fetch_meta, pending))
+
+        return snapshots
+
+    def materialize_tree(self):
+        """Reads the whole tree under the current snapshot into memory.
+
+        :returns: A view of the tree that answers lookups without calling VIX.
+        :rtype: .SnapshotTree
+
+        :raises vix.VixError: On failure to read the snapshot tree.
+        """
+
+        return SnapshotTree(self)
+
+    async def get_child_async(self, child_index):
+        """Gets a child snapshot at the designated index without blocking the event loop.
+
+        :param int child_index: Index of child snapshot.
+
+        :returns: Snapshot at specified index.
+        :rtype: .VixSnapshot
+
+        :raises vix.VixError: On failure to retrieve snapshot.
+        """
+
+        return await _to_thread(self.get_child, child_index)
+
+    async def children_async(self):
+        """Gets all children of the current snapshot, fetching them concurrently.
+
+        :returns: List of child snapshots.
+        :rtype: list
+
+        :raises vix.VixError: On failure to retrieve child snapshots.
+        """
+
+        count = await _to_thread(self.get_num_children)
+        return await asyncio.gather(*(self.get_child_async(i) for i in range(count)))
+
+    async def walk_async(self):
+        """Iterates over the current snapshot and all of its descendants, depth first.
+
+        Siblings are fetched concurrently.
+
+        :returns: An asynchronous generator yielding this snapshot followed by its descendants.
+
+        :raises vix.VixError: On failure to enumerate child snapshots.
+        """
+
+        pending = [self]
+        while pending:
+            snapshot = pending.pop()
+            yield snapshot
+
+            # Pushed in reverse so the children are visited in order.
+            pending.extend(reversed(await snapshot.children_async()))
+
+
+class SnapshotTree(object):
+    """An in-memory copy of a snapshot tree, created by :meth:`VixSnapshot.materialize_tree`.
+
+    Only snapshots that belong to the tree can be looked up.
+
+    .. note:: The tree isn't updated when snapshots are created or removed, call :meth:`refresh` to read it again.
+
+    .. note:: The tree owns the handles of its snapshots except the root. A refresh releases the
+        snapshots of the previous read, don't keep them beyond it.
+    """
+
+    def __init__(self, root):
+        self._root = root
+        self._nodes = dict()
+        self.refresh()
+
+    @property
+    def root(self):
+        """Gets the snapshot the tree was materialized from.
+
+        :rtype: .VixSnapshot
+        """
+
+        return self._root
+
+    def refresh(self):
+        """Reads the snapshot tree from VIX again.
+
+        Snapshots returned by the tree before the refresh are released, except the root.
+
+        :raises vix.VixError: On failure to read the snapshot tree.
+        """
+
+        self._root.refresh()
+
+        # Walked here rather than with walk(), so the stored children are the objects that get visited.
+        nodes = dict()
+        pending = [(self._root, None)]
+        while pending:
+            snapshot, parent = pending.pop()
+            if snapshot._name is None:
+                snapshot._fetch_meta()
+
+            children = snapshot.get_children()
+            nodes[snapshot._handle] = (snapshot, parent, children)
+            pending.extend((child, snapshot) for child in reversed(children))
+
+        stale, self._nodes = self._nodes, nodes
+        for snapshot, _, _ in stale.values():
+            if snapshot is not self._root:
+                snapshot.release()
+
+    def get_parent(self, snapshot):
+        """Gets the parent of a snapshot in the tree.
+
+        :param .VixSnapshot snapshot: A snapshot of the tree.
+
+        :returns: Parent of the snapshot or None if snapshot is the tree's root.
+        :rtype: .VixSnapshot
+
+        :raises KeyError: If the snapshot isn't part of the tree.
+        """
+
+        return self._nodes[snapshot._handle][1]
+
+    def get_num_children(self, snapshot):
+        """Gets the number of children a snapshot in the tree has.
+
+        :param .VixSnapshot snapshot: A snapshot of the tree.
+
+        :rtype: int
+
+        :raises KeyError: If the snapshot isn't part of the tree.
+        """
+
+        return len(self._nodes[snapshot._handle][2])
+
+    def get_child(self, snapshot, child_index):
+        """Gets a child of a snapshot in the tree.
+
+        :param .VixSnapshot snapshot: A snapshot of the tree.
+        :param int child_index: Index of child snapshot.
+
+        :rtype: .VixSnapshot
+
+        :raises KeyError: If the snapshot isn't part of the tree.
+        :raises IndexError: If the child index is out of range.
+        """
+
+        return self._nodes[snapshot._handle][2][child_index]
+
+    def get_children(self, snapshot):
+        """Gets all children of a snapshot in the tree.
+
+        :param .VixSnapshot snapshot: A snapshot of the tree.
+
+        :rtype: list
+
+        :raises KeyError: If the snapshot isn't part of the tree.
+        """
+
+        return list(self._nodes[snapshot._handle][2])
+
+    def __contains__(self, snapshot):
+        return snapshot._handle in self._nodes
+
+    def __iter__(self):
+        return (node[0] for node in self._nodes.values())
 
-        return VixSnapshot(parent_handle[0])
+    def __len__(self):
+        return len(self._nodes)
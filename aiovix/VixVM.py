@@ -1,71 +1,228 @@
 import asyncio
-import collections
-from multiprocessing import Event
+import datetime
+import functools
+import math
+import time
+import typing
+import weakref
+from threading import Event
 
 from .VixError import VixError
-from .VixHandle import VixHandle
+from .VixHandle import VixHandle, _release_handle, _Scratch
 from .VixSnapshot import VixSnapshot
 from .VixJob import VixJob
 from aiovix import _backend, API_ENCODING
 vix = _backend._vix
 ffi = _backend._ffi
 
+# Constant arguments, cast once instead of on every call.
+_NULL_HANDLE = ffi.cast('VixHandle', 0)
+_NULL_EVT = ffi.NULL
+_NULL_VOID = ffi.NULL
+_NULL_CHARP = ffi.NULL
+_ZERO_INT = ffi.cast('int', 0)
+_PROPERTY_NONE = ffi.cast('VixPropertyType', VixHandle.VIX_PROPERTY_NONE)
+_PROPERTY_SCREEN_IMAGE_DATA = ffi.cast('VixPropertyType', VixJob.VIX_PROPERTY_JOB_RESULT_SCREEN_IMAGE_DATA)
+
+if vix is not None:
+    _JobWait = vix.VixJob_Wait
+    _ReleaseHandle = vix.Vix_ReleaseHandle
+    _FreeBuffer = vix.Vix_FreeBuffer
+
+_VIX_OK = VixError.VIX_OK
+
+
+@functools.lru_cache(maxsize=1024)
+def _enc(s):
+    """Encodes a string for VIX as NUL terminated bytes, paths and names are often passed repeatedly.
+
+    .. note:: Internal use.
+    """
+
+    return s.encode(API_ENCODING) + b'\0'
+
+
+def _cstr(s, cached=True):
+    """Converts a string to a C string for a VIX call.
+
+    The returned cdata points into the encoded bytes and keeps them alive,
+    VIX only reads these arguments.
+
+    :param bool cached: False for secrets and one-off payloads that shouldn't be kept in the encoding cache.
+
+    .. note:: Internal use.
+    """
+
+    return ffi.from_buffer('char[]', _enc(s) if cached else s.encode(API_ENCODING) + b'\0')
+
+
+# Out-parameters of capture_screen_image.
+_scratch = _Scratch(size='int*', data='char**')
+
+
+# Seconds VIX waits for guest tools per poll in VixVM.wait_for_tools.
+_TOOLS_POLL_INTERVAL = 5
+
+def _start_job(vix_function, *args, waiter_type=None):
+    """Starts a VIX job that reports its completion through _callback_handler.
+
+    :param vix_function: A VIX function, called with args, the callback and the waiter as client data.
+
+    :returns: A tuple: (job, waiter), the waiter is done once the job completed.
+
+    .. note:: Internal use.
+    """
+
+    waiter = (waiter_type or _JobWaiter)()
+    try:
+        job = VixJob(vix_function(*args, _CALLBACK, waiter._c_handle))
+    except BaseException:
+        _pending_jobs.discard(waiter)
+        raise
+
+    return job, waiter
+
+
+async def _complete_job(vix_function, *args):
+    """Starts a VIX job and waits for its completion without holding a thread.
+
+    Results are read with the returned job's wait(), which returns right away.
+
+    :param vix_function: A VIX function, called with args, the callback and the waiter as client data.
+
+    :returns: The completed job.
+    :rtype: VixJob
+
+    .. note:: Internal use.
+    """
+
+    job, waiter = _start_job(vix_function, *args)
+    await waiter.wait_async()
+    return job
+
+
+def _vixjob_wait_only(handle):
+    """Waits for a VIX job without results and releases it, without a VixJob wrapper.
+
+    :raises vix.VixError: If job failed.
+
+    .. note:: Internal use.
+    """
+
+    try:
+        error_code = _JobWait(handle, _PROPERTY_NONE)
+    finally:
+        _ReleaseHandle(handle)
+
+    if error_code != _VIX_OK:
+        raise VixError(error_code)
+
 
 def _blocking_job(f):
-    def decorator(*args, **kwargs):
-        job = f(*args, **kwargs)
-        VixJob(job).wait()
+    def decorator(self, *args, **kwargs):
+        _vixjob_wait_only(f(self, *args, **kwargs))
+        self._invalidate_properties()
 
     # allows sphinx to generate docs normally...
     decorator.__doc__ = f.__doc__
 
     return decorator
 
-DirectoryListEntry = collections.namedtuple('DirectoryListEntry', 'name size is_dir is_sym last_mod')
-ProcessListEntry = collections.namedtuple('ProcessListEntry', 'name pid owner cmd is_debug start_time')
-SharedFolder = collections.namedtuple('SharedFolder', 'name host_path write_access')
-Process = collections.namedtuple('Process', 'pid exit_code elapsed_time')
+class DirectoryListEntry(typing.NamedTuple):
+    name: typing.Optional[str]
+    size: int
+    is_dir: bool
+    is_sym: bool
+    last_mod: datetime.datetime
 
-from threading import Event, Lock
-_proc_jobs_lock = Lock()
-_proc_jobs = dict()
-_idx = 1
 
-class _ProcJob():
-    pid = None
-    exit_code = None
-    elapsed_time = None
+class ProcessListEntry(typing.NamedTuple):
+    name: str
+    pid: int
+    owner: str
+    cmd: str
+    is_debug: bool
+    start_time: datetime.datetime
 
-    def __init__(self) -> None:
-        self._done_evt = Event()
 
-        global _proc_jobs_lock
-        _proc_jobs_lock.acquire(blocking=True)
-        global _idx
-        self._id = _idx
-        _idx += 1
+class SharedFolder(typing.NamedTuple):
+    name: str
+    host_path: str
+    write_access: bool
 
-        global _proc_jobs
-        _proc_jobs[self._id] = self
-        _proc_jobs_lock.release()
 
-    def id(self):
-        return self._id
+class Process(typing.NamedTuple):
+    pid: int
+    exit_code: typing.Optional[int]
+    elapsed_time: typing.Optional[int]
 
-    @staticmethod
-    def by_id(id):
-        global _proc_jobs
-        _proc_jobs_lock.acquire(blocking=True)
-        job = _proc_jobs.get(id)
-        _proc_jobs_lock.release()
-        return job
+
+# Keeps waiters alive until their completion callback ran, VIX only holds a raw pointer to them.
+_pending_jobs = set()
+
+class _JobWaiter():
+    """Completion of a VIX job, signalled by _callback_handler.
+
+    .. note:: Internal use.
+    """
+
+    def __init__(self) -> None:
+        # The threading event serves sync waiters, the asyncio event is created by the first async waiter.
+        self._done_evt = Event()
+        self._loop = None
+        self._async_evt = None
+
+        # Passed to VIX as the callback's client data and resolved with ffi.from_handle.
+        self._c_handle = ffi.new_handle(self)
+        _pending_jobs.add(self)
 
     def wait(self):
         self._done_evt.wait()
-    
-    async def wait(self):
-        coro = asyncio.to_thread(self.wait)
-        await asyncio.create_task(coro)
+
+    async def wait_async(self):
+        if self._done_evt.is_set():
+            return
+
+        # Later awaiters share the first one's event, which must be on the same loop.
+        if self._async_evt is None:
+            self._async_evt = asyncio.Event()
+            self._loop = asyncio.get_running_loop()
+            # _set_done sets the threading event before reading the loop, so checking again can't miss the completion.
+            if self._done_evt.is_set():
+                return
+
+        await self._async_evt.wait()
+
+    def _completed(self, job_handle):
+        """Reads results off the completed job, called from the VIX callback thread."""
+
+    def _set_done(self):
+        """Wakes up waiters, called from the VIX callback thread."""
+
+        self._done_evt.set()
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._async_evt.set)
+            except RuntimeError:
+                # The loop was closed while the job ran, nobody is waiting anymore.
+                pass
+
+
+class _ProcJob(_JobWaiter):
+    pid = None
+    exit_code = None
+    elapsed_time = None
+
+    def _completed(self, job_handle):
+        try:
+            self.pid, self.exit_code, self.elapsed_time = VixHandle(job_handle).get_properties(
+                VixJob.VIX_PROPERTY_JOB_RESULT_PROCESS_ID,
+                VixJob.VIX_PROPERTY_JOB_RESULT_GUEST_PROGRAM_EXIT_CODE,
+                VixJob.VIX_PROPERTY_JOB_RESULT_GUEST_PROGRAM_ELAPSED_TIME
+            )
+        except VixError:
+            # The program failed to run, its error is raised when the job's result is read.
+            pass
 
 
 class VixVM(VixHandle):
@@ -130,6 +287,57 @@ class VixVM(VixHandle):
 
         assert self.get_type() == VixHandle.VIX_HANDLETYPE_VM, 'Expected VixVM handle.'
 
+        # Releases the handle once, either explicitly through release() or when the VM is collected.
+        self._finalizer = weakref.finalize(self, _release_handle, self._handle)
+
+        self._prop_cache = dict()
+        self._prop_cache_time = 0.0
+
+    def snapshot_properties(self, *props, _cache_ttl=0.5):
+        """Gets several VM properties with a single VIX call.
+
+        Values fetched less than `_cache_ttl` seconds ago are served from a cache,
+        jobs started through this object that may change the VM drop the cache.
+        The power_state, is_running and tools_state accessors are always read live,
+        since they also change outside this object.
+
+        :param props: VixHandle.VIX_PROPERTY_VM_* ids.
+
+        :returns: A tuple of values, in the order of `props`.
+        :rtype: tuple
+
+        :raises vix.VixError: On failure to get the properties.
+        """
+
+        now = time.monotonic()
+        cache = self._prop_cache
+        if now - self._prop_cache_time > _cache_ttl:
+            cache.clear()
+            self._prop_cache_time = now
+
+        missing = [prop for prop in props if prop not in cache]
+        if missing:
+            values = self.get_properties(*missing)
+            cache.update(zip(missing, values if len(missing) > 1 else (values, )))
+
+        return tuple(cache[prop] for prop in props)
+
+    def _cached(self, prop):
+        """Gets a VM property through the property cache, fetching only this property on a miss.
+
+        .. note:: Internal use.
+        """
+
+        return self.snapshot_properties(prop)[0]
+
+    def _invalidate_properties(self):
+        """Drops cached properties, called after jobs that may change the VM's state.
+
+        .. note:: Internal use.
+        """
+
+        self._prop_cache.clear()
+
     @property
     def vmx_path(self):
         """Gets VM'x vmx path.
@@ -138,7 +346,7 @@ class VixVM(VixHandle):
         :rtype: str
         """
 
-        return self.get_properties(VixHandle.VIX_PROPERTY_VM_VMX_PATHNAME)
+        return self._cached(VixHandle.VIX_PROPERTY_VM_VMX_PATHNAME)
 
     @property
     def machine_info(self):
@@ -148,9 +356,9 @@ class VixVM(VixHandle):
         :rtype: tuple
         """
 
-        return self.get_properties(
-            VixHandle.VIX_PROPERTY_VM_NUM_VCPUS, 
-            VixHandle.VIX_PROPERTY_VM_MEMORY_SIZE
+        return self.snapshot_properties(
+            VixHandle.VIX_PROPERTY_VM_NUM_VCPUS,
+            VixHandle.VIX_PROPERTY_VM_MEMORY_SIZE,
         )
 
     @property
@@ -170,7 +378,7 @@ class VixVM(VixHandle):
         :rtype: str
         """
 
-        return self.get_properties(VixHandle.VIX_PROPERTY_VM_GUESTOS)
+        return self._cached(VixHandle.VIX_PROPERTY_VM_GUESTOS)
 
     @property
     def name(self):
@@ -179,7 +387,7 @@ class VixVM(VixHandle):
         :rtype: str
         """
 
-        return self.get_properties(VixHandle.VIX_PROPERTY_VM_NAME)
+        return self._cached(VixHandle.VIX_PROPERTY_VM_NAME)
 
     @property
     def is_readonly(self):
@@ -188,7 +396,7 @@ class VixVM(VixHandle):
         :rtype: bool
         """
 
-        return self.get_properties(VixHandle.VIX_PROPERTY_VM_READ_ONLY)
+        return self._cached(VixHandle.VIX_PROPERTY_VM_READ_ONLY)
 
     @property
     def power_state(self):
@@ -217,10 +425,26 @@ class VixVM(VixHandle):
         :returns: Any of VixVM.VIX_VM_SUPPORT_*.
         :rtype: int
         """
-        return self.get_properties(VixHandle.VIX_PROPERTY_VM_SUPPORTED_FEATURES)
+        return self._cached(VixHandle.VIX_PROPERTY_VM_SUPPORTED_FEATURES)
 
     def __repr__(self):
-        return "<VixVM @ {0}>".format(self.vmx_path)
+        return "<VixVM @ {0}>".format(self._cached(VixHandle.VIX_PROPERTY_VM_VMX_PATHNAME))
+
+    async def _run_job(self, vix_function, *args):
+        """Starts a VIX job on the VM and waits for it to complete.
+
+        :param vix_function: A VixVM_* function, called with the VM handle, args and the completion callback.
+
+        :raises vix.VixError: If the job failed.
+
+        .. note:: Internal use.
+        """
+
+        try:
+            job = await _complete_job(vix_function, self._handle, *args)
+            return job.wait()
+        finally:
+            self._invalidate_properties()
 
     # Power
     async def pause(self):
@@ -229,16 +453,12 @@ class VixVM(VixHandle):
         .. note:: This method is not supported by all VMware products.
         """
 
-        job = vix.VixVM_Pause(
-            self._handle,
-            ffi.cast('int', 0),
-            ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+        return await self._run_job(
+            vix.VixVM_Pause,
+            _ZERO_INT,
+            _NULL_HANDLE,
         )
 
-        return await VixJob(job).wait_async()
-
     async def power_off(self, from_guest=False):
         """Powers off a VM.
 
@@ -247,15 +467,11 @@ class VixVM(VixHandle):
         :raises vix.VixError: On failure to power off VM.
         """
 
-        job = vix.VixVM_PowerOff(
-            self._handle,
-            ffi.cast('VixVMPowerOpOptions', self.VIX_VMPOWEROP_FROM_GUEST if from_guest else self.VIX_VMPOWEROP_NORMAL),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+        return await self._run_job(
+            vix.VixVM_PowerOff,
+            _POWEROP_FROM_GUEST if from_guest else _POWEROP_NORMAL,
         )
 
-        return await VixJob(job).wait_async()
-
     async def power_on(self, launch_gui=False):
         """Powers on a VM.
 
@@ -264,16 +480,12 @@ class VixVM(VixHandle):
         :raises vix.VixError: On failure to power on VM.
         """
 
-        job = vix.VixVM_PowerOn(
-            self._handle,
-            ffi.cast('VixVMPowerOpOptions', self.VIX_VMPOWEROP_LAUNCH_GUI if launch_gui else self.VIX_VMPOWEROP_NORMAL),
-            ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+        return await self._run_job(
+            vix.VixVM_PowerOn,
+            _POWEROP_LAUNCH_GUI if launch_gui else _POWEROP_NORMAL,
+            _NULL_HANDLE,
         )
 
-        return await VixJob(job).wait_async()
-
     async def reset(self, from_guest=False):
         """Resets a virtual machine.
 
@@ -282,14 +494,10 @@ class VixVM(VixHandle):
         :raises vix.VixError: On failure to reset VM.
         """
 
-        job = vix.VixVM_Reset(
-            self._handle,
-            ffi.cast('VixVMPowerOpOptions', self.VIX_VMPOWEROP_FROM_GUEST if from_guest else self.VIX_VMPOWEROP_NORMAL),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+        return await self._run_job(
+            vix.VixVM_Reset,
+            _POWEROP_FROM_GUEST if from_guest else _POWEROP_NORMAL,
         )
-        
-        return await VixJob(job).wait_async()
 
     async def suspend(self):
         """Suspends a virtual machine.
@@ -297,15 +505,11 @@ class VixVM(VixHandle):
         :raises vix.VixError: On failure to suspend VM.
         """
 
-        job = vix.VixVM_Suspend(
-            self._handle,
-            ffi.cast('VixVMPowerOpOptions', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+        return await self._run_job(
+            vix.VixVM_Suspend,
+            _POWEROP_NORMAL,
         )
 
-        return await VixJob(job).wait_async()
-
     async def unpause(self):
         """Resumes execution of a paused virtual machine.
 
@@ -314,15 +518,11 @@ class VixVM(VixHandle):
         .. note:: This method is not supported by all Vmware products.
         """
 
-        job = vix.VixVM_Unpause(
-            self._handle,
-            ffi.cast('int', 0),
-            ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+        return await self._run_job(
+            vix.VixVM_Unpause,
+            _ZERO_INT,
+            _NULL_HANDLE,
         )
-        
-        return await VixJob(job).wait_async()
 
     # Snapshots
     async def clone(self, dest_vmx, snapshot=None, linked=False):
@@ -340,18 +540,16 @@ class VixVM(VixHandle):
         .. note:: This method is not supported by all VMware products.
         """
 
-        job = vix.VixVM_Clone(
+        job = await _complete_job(
+            vix.VixVM_Clone,
             self._handle,
             ffi.cast('VixHandle', snapshot._handle if snapshot else 0),
             ffi.cast('VixCloneType', self._VIX_CLONETYPE_LINKED if linked else self._VIX_CLONETYPE_FULL),
-            ffi.new('char[]', bytes(dest_vmx, API_ENCODING)),
-            ffi.cast('int', 0),
-            ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _cstr(dest_vmx),
+            _ZERO_INT,
+            _NULL_HANDLE,
         )
-    
-        handle = await VixJob(job).wait_async(VixJob.VIX_PROPERTY_JOB_RESULT_HANDLE)
+        handle = job.wait(VixJob.VIX_PROPERTY_JOB_RESULT_HANDLE)
         return VixVM(handle)
 
     async def create_snapshot(self, name=None, description=None, include_memory=True):
@@ -369,17 +567,15 @@ class VixVM(VixHandle):
         .. note:: This method is not supported by all VMware products.
         """
 
-        job = vix.VixVM_CreateSnapshot(
+        job = await _complete_job(
+            vix.VixVM_CreateSnapshot,
             self._handle,
-            ffi.new('char[]', bytes(name, API_ENCODING)) if name else ffi.cast('char*', 0),
-            ffi.new('char[]', bytes(description, API_ENCODING)) if description else  ffi.cast('char*', 0),
+            _cstr(name) if name else _NULL_CHARP,
+            _cstr(description, cached=False) if description else  _NULL_CHARP,
             ffi.cast('int', self._VIX_SNAPSHOT_INCLUDE_MEMORY if include_memory else 0),
-            ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _NULL_HANDLE,
         )
-
-        handle = await VixJob(job).wait_async(VixJob.VIX_PROPERTY_JOB_RESULT_HANDLE)
+        handle = job.wait(VixJob.VIX_PROPERTY_JOB_RESULT_HANDLE)
         return VixSnapshot(handle)
 
     def snapshot_get_current(self):
@@ -420,7 +616,7 @@ class VixVM(VixHandle):
         snapshot_handle = ffi.new('VixHandle*')
         error_code = vix.VixVM_GetNamedSnapshot(
             self._handle,
-            ffi.new('char[]', bytes(name, API_ENCODING)),
+            _cstr(name),
             snapshot_handle,
         )
 
@@ -487,16 +683,12 @@ class VixVM(VixHandle):
         .. note:: This method is not supported by all VMware products.
         """
 
-        job = vix.VixVM_RevertToSnapshot(
-            self._handle,
+        return await self._run_job(
+            vix.VixVM_RevertToSnapshot,
             snapshot._handle,
             ffi.cast('int', options),
-            ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _NULL_HANDLE,
         )
-        
-        return await VixJob(job).wait_async()
 
     async def snapshot_remove(self, snapshot, remove_children=False):
         """Removed specified snapshot from VM.
@@ -509,15 +701,11 @@ class VixVM(VixHandle):
         .. note:: This method is not supported by all VMware products.
         """
 
-        job = vix.VixVM_RemoveSnapshot(
-            self._handle,
+        return await self._run_job(
+            vix.VixVM_RemoveSnapshot,
             snapshot._handle,
             ffi.cast('int', self._VIX_SNAPSHOT_REMOVE_CHILDREN if remove_children else 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
         )
-        
-        return await VixJob(job).wait_async()
 
     # Guest & Host file mgmt.
     async def copy_guest_to_host(self, guest_path, host_path):
@@ -529,17 +717,15 @@ class VixVM(VixHandle):
         :raises vix.VixError: If copy failed.
         """
 
-        job = vix.VixVM_CopyFileFromGuestToHost(
+        job = await _complete_job(
+            vix.VixVM_CopyFileFromGuestToHost,
             self._handle,
-            ffi.new('char[]', bytes(guest_path, API_ENCODING)),
-            ffi.new('char[]', bytes(host_path, API_ENCODING)),
-            ffi.cast('int', 0),
-            ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _cstr(guest_path),
+            _cstr(host_path),
+            _ZERO_INT,
+            _NULL_HANDLE,
         )
-        
-        return await VixJob(job).wait_async()
+        return job.wait()
 
     async def copy_host_to_guest(self, host_path, guest_path):
         """Copies a file or directory from host to VM.
@@ -550,17 +736,15 @@ class VixVM(VixHandle):
         :raises vix.VixError: If failed to copy.
         """
 
-        job = vix.VixVM_CopyFileFromHostToGuest(
+        job = await _complete_job(
+            vix.VixVM_CopyFileFromHostToGuest,
             self._handle,
-            ffi.new('char[]', bytes(host_path, API_ENCODING)),
-            ffi.new('char[]', bytes(guest_path, API_ENCODING)),
-            ffi.cast('int', 0),
-            ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _cstr(host_path),
+            _cstr(guest_path),
+            _ZERO_INT,
+            _NULL_HANDLE,
         )
-        
-        return await VixJob(job).wait_async()
+        return job.wait()
 
     @_blocking_job
     def create_directory(self, path):
@@ -575,10 +759,10 @@ class VixVM(VixHandle):
 
         return vix.VixVM_CreateDirectoryInGuest(
             self._handle,
-            ffi.new('char[]', bytes(path, API_ENCODING)),
-            ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _cstr(path),
+            _NULL_HANDLE,
+            _NULL_EVT,
+            _NULL_VOID,
         )
 
     def create_temp(self):
@@ -594,10 +778,10 @@ class VixVM(VixHandle):
 
         job = VixJob(vix.VixVM_CreateTempFileInGuest(
             self._handle,
-            ffi.cast('int', 0),
-            ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _ZERO_INT,
+            _NULL_HANDLE,
+            _NULL_EVT,
+            _NULL_VOID,
         ))
 
         return job.wait(VixJob.VIX_PROPERTY_JOB_RESULT_ITEM_NAME)
@@ -616,12 +800,12 @@ class VixVM(VixHandle):
 
         return vix.VixVM_RenameFileInGuest(
             self._handle,
-            ffi.new('char[]', bytes(old_name, API_ENCODING)),
-            ffi.new('char[]', bytes(new_name, API_ENCODING)),
-            ffi.cast('int', 0),
-            ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _cstr(old_name),
+            _cstr(new_name),
+            _ZERO_INT,
+            _NULL_HANDLE,
+            _NULL_EVT,
+            _NULL_VOID,
         )
 
     @_blocking_job
@@ -637,10 +821,10 @@ class VixVM(VixHandle):
 
         return vix.VixVM_DeleteDirectoryInGuest(
             self._handle,
-            ffi.new('char[]', bytes(path, API_ENCODING)),
-            ffi.cast('int', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _cstr(path),
+            _ZERO_INT,
+            _NULL_EVT,
+            _NULL_VOID,
         )
 
     @_blocking_job
@@ -656,9 +840,9 @@ class VixVM(VixHandle):
 
         return vix.VixVM_DeleteFileInGuest(
             self._handle,
-            ffi.new('char[]', bytes(path, API_ENCODING)),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _cstr(path),
+            _NULL_EVT,
+            _NULL_VOID,
         )
 
     def dir_exists(self, path):
@@ -676,9 +860,9 @@ class VixVM(VixHandle):
 
         job = VixJob(vix.VixVM_DirectoryExistsInGuest(
             self._handle,
-            ffi.new('char[]', bytes(path, API_ENCODING)),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _cstr(path),
+            _NULL_EVT,
+            _NULL_VOID,
         ))
 
         return bool(job.wait(VixJob.VIX_PROPERTY_JOB_RESULT_GUEST_OBJECT_EXISTS))
@@ -698,9 +882,9 @@ class VixVM(VixHandle):
 
         job = VixJob(vix.VixVM_FileExistsInGuest(
             self._handle,
-            ffi.new('char[]', bytes(path, API_ENCODING)),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _cstr(path),
+            _NULL_EVT,
+            _NULL_VOID,
         ))
 
         return bool(job.wait(VixJob.VIX_PROPERTY_JOB_RESULT_GUEST_OBJECT_EXISTS))
@@ -720,18 +904,16 @@ class VixVM(VixHandle):
 
         job = VixJob(vix.VixVM_GetFileInfoInGuest(
             self._handle,
-            ffi.new('char[]', bytes(path, API_ENCODING)),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _cstr(path),
+            _NULL_EVT,
+            _NULL_VOID,
         ))
         job.wait()
-        res = job.get_properties(
+        res = job.get_property_single(
             VixJob.VIX_PROPERTY_JOB_RESULT_FILE_SIZE,
             VixJob.VIX_PROPERTY_JOB_RESULT_FILE_FLAGS,
             VixJob.VIX_PROPERTY_JOB_RESULT_FILE_MOD_TIME,
         )
-        assert len(res) == 1, 'Expected single result'
-        res = res[0]
         return DirectoryListEntry(
             name=None,
             size=res[0],
@@ -754,10 +936,10 @@ class VixVM(VixHandle):
 
         job = VixJob(vix.VixVM_ListDirectoryInGuest(
             self._handle,
-            ffi.new('char[]', bytes(path, API_ENCODING)),
-            ffi.cast('int', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _cstr(path),
+            _ZERO_INT,
+            _NULL_EVT,
+            _NULL_VOID,
         ))
         job.wait()
         
@@ -768,18 +950,14 @@ class VixVM(VixHandle):
             VixJob.VIX_PROPERTY_JOB_RESULT_FILE_MOD_TIME,
         )
 
-        result = list()
+        entry_type = DirectoryListEntry
+        is_dir = VixJob.VIX_FILE_ATTRIBUTES_DIRECTORY
+        is_sym = VixJob.VIX_FILE_ATTRIBUTES_SYMLINK
 
-        for res in job_result:
-            result.append(DirectoryListEntry(
-                name=res[0],
-                size=res[1],
-                is_dir=bool(res[2] & VixJob.VIX_FILE_ATTRIBUTES_DIRECTORY),
-                is_sym=bool(res[2] & VixJob.VIX_FILE_ATTRIBUTES_SYMLINK),
-                last_mod=res[3],
-            ))
-
-        return result
+        return [
+            entry_type(name, size, (flags & is_dir) != 0, (flags & is_sym) != 0, last_mod)
+            for name, size, flags, last_mod in job_result
+        ]
 
     # Guest execution
     async def proc_kill(self, pid):
@@ -792,15 +970,13 @@ class VixVM(VixHandle):
         .. note:: This method is not supported by all VMware products.
         """
 
-        job = vix.VixVM_KillProcessInGuest(
+        job = await _complete_job(
+            vix.VixVM_KillProcessInGuest,
             self._handle,
             ffi.cast('uint64', pid),
-            ffi.cast('int', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _ZERO_INT,
         )
-        
-        return await VixJob(job).wait_async()
+        return job.wait()
 
     def proc_list(self):
         """Gets the guest's process list.
@@ -815,28 +991,27 @@ class VixVM(VixHandle):
 
         job = VixJob(vix.VixVM_ListProcessesInGuest(
             self._handle,
-            ffi.cast('int', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _ZERO_INT,
+            _NULL_EVT,
+            _NULL_VOID,
         ))
 
         job.wait()
 
-        return [ProcessListEntry(
-            name=entry[0],
-            pid=entry[1],
-            owner=entry[2],
-            cmd=entry[3],
-            is_debug=entry[4],
-            start_time=entry[5],
-        ) for entry in job.get_properties(
+        job_result = job.get_properties(
             VixJob.VIX_PROPERTY_JOB_RESULT_ITEM_NAME,
             VixJob.VIX_PROPERTY_JOB_RESULT_PROCESS_ID,
             VixJob.VIX_PROPERTY_JOB_RESULT_PROCESS_OWNER,
             VixJob.VIX_PROPERTY_JOB_RESULT_PROCESS_COMMAND,
             VixJob.VIX_PROPERTY_JOB_RESULT_PROCESS_BEING_DEBUGGED,
             VixJob.VIX_PROPERTY_JOB_RESULT_PROCESS_START_TIME,
-        )]
+        )
+
+        entry_type = ProcessListEntry
+        return [
+            entry_type(name, pid, owner, cmd, is_debug, start_time)
+            for name, pid, owner, cmd, is_debug, start_time in job_result
+        ]
 
     async def login(self, username, password, require_interactive=False):
         """Login to the guest to allow further executions.
@@ -848,16 +1023,14 @@ class VixVM(VixHandle):
         :raises vix.VixError: On failure to authenticate.
         """
 
-        job = vix.VixVM_LoginInGuest(
+        job = await _complete_job(
+            vix.VixVM_LoginInGuest,
             self._handle,
-            ffi.new('char[]', bytes(username, API_ENCODING)) if username else ffi.cast('char*', 0),
-            ffi.new('char[]', bytes(password, API_ENCODING)) if password else ffi.cast('char*', 0),
+            _cstr(username) if username else _NULL_CHARP,
+            _cstr(password, cached=False) if password else _NULL_CHARP,
             ffi.cast('int', self._VIX_LOGIN_IN_GUEST_REQUIRE_INTERACTIVE_ENVIRONMENT if require_interactive else 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
         )
-        
-        return await VixJob(job).wait_async()
+        return job.wait()
 
     async def logout(self):
         """Logout from guest. Closes any previous login context.
@@ -867,48 +1040,77 @@ class VixVM(VixHandle):
         .. note:: This method is not supported by all VMware products.
         """
 
-        job = vix.VixVM_LogoutFromGuest(
+        job = await _complete_job(
+            vix.VixVM_LogoutFromGuest,
             self._handle,
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
         )
-        
-        return await VixJob(job).wait_async()
+        return job.wait()
 
     async def proc_run(self, program_name, command_line=None, should_block=True) -> Process:
         """Executes a process in guest VM.
 
         :param str program_name: Name of program to execute in guest.
         :param str command_line: Command line to execute program with.
-        :param bool should_block: If set to True, function will block until process exits in guest. If set to False - the returned `_ProcJob` will not have the exit_code or elapsed_time set.
+        :param bool should_block: If set to True, function will block until process exits in guest. If set to False - the returned `Process` will not have the exit_code or elapsed_time set.
 
-        :returns: _ProcJob.
+        :returns: Process.
 
         :raises vix.VixError: On failure to execute process.
 
         .. note:: This method is not supported by all VMware products.
         """
 
-        pj = _ProcJob()
+        job, pj = self._start_proc(program_name, command_line, should_block)
+        # The callback fires once the job completed, reading its result doesn't block afterwards.
+        await pj.wait_async()
+        pid = job.wait(VixJob.VIX_PROPERTY_JOB_RESULT_PROCESS_ID)
 
-        job = vix.VixVM_RunProgramInGuest(
-            self._handle,
-            ffi.new('char[]', bytes(program_name, API_ENCODING)),
-            ffi.new('char[]', bytes(command_line, API_ENCODING)) if command_line else ffi.cast('char*', 0),
-            ffi.cast('VixRunProgramOptions', 0 if should_block else self._VIX_RUNPROGRAM_RETURN_IMMEDIATELY),
-            ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', _callback_handler),
-            ffi.cast('void*', pj.id()),
-        )
-        pid = await VixJob(job).wait_async(VixJob.VIX_PROPERTY_JOB_RESULT_PROCESS_ID)
+        if should_block:
+            return Process(pid, pj.exit_code, pj.elapsed_time)
+        else:
+            return Process(pid, None, None)
+
+    def proc_run_sync(self, program_name, command_line=None, should_block=True) -> Process:
+        """Executes a process in guest VM, blocking the calling thread.
+
+        Same as :meth:`proc_run`, for callers that are not running an event loop.
+
+        :param str program_name: Name of program to execute in guest.
+        :param str command_line: Command line to execute program with.
+        :param bool should_block: If set to True, function will block until process exits in guest.
+
+        :returns: Process.
+
+        :raises vix.VixError: On failure to execute process.
+        """
+
+        job, pj = self._start_proc(program_name, command_line, should_block)
+        pj.wait()
+        pid = job.wait(VixJob.VIX_PROPERTY_JOB_RESULT_PROCESS_ID)
 
         if should_block:
-            pj.pid = pid
-            pj.wait()  # TODO shouldmake this awaitable
             return Process(pid, pj.exit_code, pj.elapsed_time)
         else:
             return Process(pid, None, None)
 
+    def _start_proc(self, program_name, command_line, should_block):
+        """Starts a guest program.
+
+        :returns: A tuple: (job, _ProcJob), the _ProcJob is done once the job completed.
+
+        .. note:: Internal use.
+        """
+
+        return _start_job(
+            vix.VixVM_RunProgramInGuest,
+            self._handle,
+            _cstr(program_name),
+            _cstr(command_line, cached=False) if command_line else _NULL_CHARP,
+            ffi.cast('VixRunProgramOptions', 0 if should_block else self._VIX_RUNPROGRAM_RETURN_IMMEDIATELY),
+            _NULL_HANDLE,
+            waiter_type=_ProcJob,
+        )
+
     async def run_script(self, script_text, interpreter_path=None, should_block=True):
         """Executes a script in guest VM.
 
@@ -921,21 +1123,19 @@ class VixVM(VixHandle):
         .. note:: This method is not supported by all VMware products.
         """
 
-        pj = _ProcJob()
-        job = vix.VixVM_RunScriptInGuest(
+        job, pj = _start_job(
+            vix.VixVM_RunScriptInGuest,
             self._handle,
-            ffi.new('char[]', bytes(interpreter_path, API_ENCODING)) if interpreter_path else ffi.cast('char*', 0),
-            ffi.new('char[]', bytes(script_text, API_ENCODING)),
+            _cstr(interpreter_path) if interpreter_path else _NULL_CHARP,
+            _cstr(script_text, cached=False),
             ffi.cast('VixRunProgramOptions', 0 if should_block else self._VIX_RUNPROGRAM_RETURN_IMMEDIATELY),
-            ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', _callback_handler),
-            ffi.cast('void*', pj.id()),
+            _NULL_HANDLE,
+            waiter_type=_ProcJob,
         )
-        pid = await VixJob(job).wait_async(VixJob.VIX_PROPERTY_JOB_RESULT_PROCESS_ID)
+        await pj.wait_async()
+        pid = job.wait(VixJob.VIX_PROPERTY_JOB_RESULT_PROCESS_ID)
 
         if should_block:
-            pj.pid = pid
-            pj.wait()
             return Process(pid, pj.exit_code, pj.elapsed_time)
         else:
             return Process(pid, None, None)
@@ -957,11 +1157,11 @@ class VixVM(VixHandle):
         # TODO: return the path of shared folder in guest.
         return vix.VixVM_AddSharedFolder(
             self._handle,
-            ffi.new('char[]', bytes(share_name, API_ENCODING)),
-            ffi.new('char[]', bytes(host_path, API_ENCODING)),
+            _cstr(share_name),
+            _cstr(host_path),
             ffi.cast('VixMsgSharedFolderOptions', self._VIX_SHAREDFOLDER_WRITE_ACCESS if write_access else 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _NULL_EVT,
+            _NULL_VOID,
         )
 
     @_blocking_job
@@ -978,9 +1178,9 @@ class VixVM(VixHandle):
         return vix.VixVM_EnableSharedFolders(
             self._handle,
             ffi.cast('Bool', int(value)),
-            ffi.cast('int', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _ZERO_INT,
+            _NULL_EVT,
+            _NULL_VOID,
         )
 
     def get_shared_folder_count(self):
@@ -991,11 +1191,11 @@ class VixVM(VixHandle):
 
         return VixJob(vix.VixVM_GetNumSharedFolders(
             self._handle,
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _NULL_EVT,
+            _NULL_VOID,
         )).wait(VixJob.VIX_PROPERTY_JOB_RESULT_SHARED_FOLDER_COUNT)
 
-    def get_shared_folder_state(self, index):
+    async def get_shared_folder_state(self, index):
         """Gets the state of a shared folder.
 
         :param int index: Index of share.
@@ -1008,25 +1208,58 @@ class VixVM(VixHandle):
         .. note:: This method is not supported by all VMware products.
         """
 
-        job = VixJob(vix.VixVM_GetSharedFolderState(
+        job = await _complete_job(
+            vix.VixVM_GetSharedFolderState,
             self._handle,
             ffi.cast('int', index),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
-        ))
+        )
         job.wait()
-        res = job.get_properties(
+        return self._shared_folder_from_job(job)
+
+    async def get_shared_folders(self):
+        """Gets the state of all shared folders.
+
+        The state jobs of all shares are started together and awaited concurrently.
+
+        :returns: list of share state information.
+        :rtype: list
+
+        :raises vix.VixError: If failed to get state.
+
+        .. note:: This method is not supported by all VMware products.
+        """
+
+        job = await _complete_job(vix.VixVM_GetNumSharedFolders, self._handle)
+        count = job.wait(VixJob.VIX_PROPERTY_JOB_RESULT_SHARED_FOLDER_COUNT)
+
+        started = [_start_job(
+            vix.VixVM_GetSharedFolderState,
+            self._handle,
+            ffi.cast('int', index),
+        ) for index in range(count)]
+
+        await asyncio.gather(*(waiter.wait_async() for _, waiter in started))
+
+        results = list()
+        for job, _ in started:
+            job.wait()
+            results.append(self._shared_folder_from_job(job))
+        return results
+
+    @staticmethod
+    def _shared_folder_from_job(job):
+        """Reads the result of a completed VixVM_GetSharedFolderState job.
+
+        .. note:: Internal use.
+        """
+
+        res = job.get_property_single(
             VixJob.VIX_PROPERTY_JOB_RESULT_ITEM_NAME,
             VixJob.VIX_PROPERTY_JOB_RESULT_SHARED_FOLDER_HOST,
             VixJob.VIX_PROPERTY_JOB_RESULT_SHARED_FOLDER_FLAGS,
         )
-        assert len(res) == 1, 'Expected single result'
-        res = res[0]
-        return SharedFolder(
-            name=res[0],
-            host_path=res[1],
-            write_access=bool(res[2] & VixVM._VIX_SHAREDFOLDER_WRITE_ACCESS),
-        )
+        name, host_path, flags = res
+        return SharedFolder(name, host_path, (flags & VixVM._VIX_SHAREDFOLDER_WRITE_ACCESS) != 0)
 
     @_blocking_job
     def share_remove(self, share_name):
@@ -1039,10 +1272,10 @@ class VixVM(VixHandle):
 
         return vix.VixVM_RemoveSharedFolder(
             self._handle,
-            ffi.new('char[]', bytes(share_name, API_ENCODING)),
-            ffi.cast('int', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _cstr(share_name),
+            _ZERO_INT,
+            _NULL_EVT,
+            _NULL_VOID,
         )
 
     @_blocking_job
@@ -1060,15 +1293,15 @@ class VixVM(VixHandle):
 
         return vix.VixVM_SetSharedFolderState(
             self._handle,
-            ffi.new('char[]', bytes(share_name, API_ENCODING)),
-            ffi.new('char[]', bytes(host_path, API_ENCODING)),
+            _cstr(share_name),
+            _cstr(host_path),
             ffi.cast('VixMsgSharedFolderOptions', VixVM._VIX_SHAREDFOLDER_WRITE_ACCESS if allow_write else 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _NULL_EVT,
+            _NULL_VOID,
         )
 
     # VM environment.
-    def var_read(self, name, variable_type=VIX_VM_GUEST_VARIABLE):
+    async def var_read(self, name, variable_type=VIX_VM_GUEST_VARIABLE):
         """Reads an environment string.
 
         :param str name: Name of variable to read.
@@ -1082,17 +1315,45 @@ class VixVM(VixHandle):
         .. note:: This method is not supported by all VMware products.
         """
 
-        job = VixJob(vix.VixVM_ReadVariable(
+        job = await _complete_job(
+            vix.VixVM_ReadVariable,
             self._handle,
             ffi.cast('int', variable_type),
-            ffi.new('char[]', bytes(name, API_ENCODING)),
-            ffi.cast('int', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
-        ))
-
+            _cstr(name),
+            _ZERO_INT,
+        )
         return job.wait(VixJob.VIX_PROPERTY_JOB_RESULT_VM_VARIABLESTRING)
 
+    async def var_read_many(self, names, variable_type=VIX_VM_GUEST_VARIABLE):
+        """Reads several environment strings.
+
+        The read jobs of all variables are started together and awaited concurrently.
+
+        :param names: Names of variables to read.
+        :param int variable_type: Must be one of VIX_VM_GUEST_VARIABLE, VIX_VM_CONFIG_RUNTIME_ONLY or VIX_GUEST_ENVIRONMENT_VARIABLE.
+
+        :returns: The values of the variables, in the order of `names`.
+        :rtype: list
+
+        :raises vix.VixError: On failure to get any of the variables.
+
+        .. note:: This method is not supported by all VMware products.
+        """
+
+        c_variable_type = ffi.cast('int', variable_type)
+        # _start_job wraps each handle right away, so already started jobs are released if a later name fails.
+        started = [_start_job(
+            vix.VixVM_ReadVariable,
+            self._handle,
+            c_variable_type,
+            _cstr(name),
+            _ZERO_INT,
+        ) for name in names]
+
+        await asyncio.gather(*(waiter.wait_async() for _, waiter in started))
+
+        return [job.wait(VixJob.VIX_PROPERTY_JOB_RESULT_VM_VARIABLESTRING) for job, _ in started]
+
     @_blocking_job
     def var_write(self, name, value, variable_type=VIX_VM_GUEST_VARIABLE):
         """Writes a string to the VM's environment.
@@ -1109,11 +1370,11 @@ class VixVM(VixHandle):
         return vix.VixVM_WriteVariable(
             self._handle,
             ffi.cast('int', variable_type),
-            ffi.new('char[]', bytes(name, API_ENCODING)),
-            ffi.new('char[]', bytes(value, API_ENCODING)),
-            ffi.cast('int', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _cstr(name),
+            _cstr(value, cached=False),
+            _ZERO_INT,
+            _NULL_EVT,
+            _NULL_VOID,
         )
 
     # Misc. methods
@@ -1128,9 +1389,9 @@ class VixVM(VixHandle):
 
         return vix.VixVM_UpgradeVirtualHardware(
             self._handle,
-            ffi.cast('int', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _ZERO_INT,
+            _NULL_EVT,
+            _NULL_VOID,
         )
 
     async def vm_delete(self, delete_files=False):
@@ -1141,14 +1402,12 @@ class VixVM(VixHandle):
         :raises vix.VixError: If failed to delete VM.
         """
 
-        job = vix.VixVM_Delete(
+        job = await _complete_job(
+            vix.VixVM_Delete,
             self._handle,
             ffi.cast('VixVMDeleteOptions', self._VIX_VMDELETE_DISK_FILES if delete_files else 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
         )
-
-        await VixJob(job).wait_async()
+        job.wait()
 
     def capture_screen_image(self, filename=None):
         """Captures a PNG screenshot from VM.
@@ -1165,54 +1424,73 @@ class VixVM(VixHandle):
 
         job = VixJob(vix.VixVM_CaptureScreenImage(
             self._handle,
-            ffi.cast('int', self._VIX_CAPTURESCREENFORMAT_PNG),
-            ffi.cast('VixHandle', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _CAPTURESCREENFORMAT_PNG,
+            _NULL_HANDLE,
+            _NULL_EVT,
+            _NULL_VOID,
         ))
 
-        bytes_ptr = ffi.new('int*')
-        data_ptr = ffi.new('char**')
+        scratch = _scratch
+        bytes_ptr = scratch.size
+        data_ptr = scratch.data
 
-        error_code = vix.VixJob_Wait(
+        error_code = _JobWait(
             job._handle,
-            ffi.cast('int', VixJob.VIX_PROPERTY_JOB_RESULT_SCREEN_IMAGE_DATA),
+            _PROPERTY_SCREEN_IMAGE_DATA,
             bytes_ptr,
             data_ptr,
-            ffi.cast('int', VixJob.VIX_PROPERTY_NONE)
+            _PROPERTY_NONE,
         )
 
-        if error_code != VixError.VIX_OK:
+        if error_code != _VIX_OK:
             raise VixError(error_code)
 
         img_len = int(bytes_ptr[0])
-        img_data = bytes(ffi.buffer(data_ptr[0], img_len))
-
-        vix.Vix_FreeBuffer(data_ptr[0])
 
-        if filename:
-            with open(filename, "wb") as fd:
-                fd.write(img_data)
-        else:
-            return img_data
+        try:
+            if filename:
+                # Written straight from the VIX buffer, without an intermediate copy.
+                with open(filename, "wb") as fd:
+                    fd.write(ffi.buffer(data_ptr[0], img_len))
+            else:
+                return ffi.unpack(data_ptr[0], img_len)
+        finally:
+            _FreeBuffer(data_ptr[0])
 
     # VMware tools
     async def wait_for_tools(self, timeout=0):
         """Waits for VMware tools to start in guest.
 
+        VIX is polled in short waits, so a VM whose tools never start doesn't hold a VIX job for the whole timeout.
+
         :param int timeout: Timeout in seconds. Zero or negative will block forever, Raises an exception if timeout expired.
 
         :raises vix.VixError: If timeout passed, Or of VIX fails.
         """
 
-        job = vix.VixVM_WaitForToolsInGuest(
-            self._handle,
-            ffi.cast('int', timeout),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
-        )
-        await VixJob(job).wait_async()
-
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout > 0 else None
+
+        while True:
+            poll = _TOOLS_POLL_INTERVAL
+            if deadline is not None:
+                poll = max(1, min(poll, math.ceil(deadline - loop.time())))
+
+            try:
+                job = await _complete_job(
+                    vix.VixVM_WaitForToolsInGuest,
+                    self._handle,
+                    ffi.cast('int', poll),
+                )
+                job.wait()
+                break
+            except VixError as ex:
+                if ex.error_code != VixError.VIX_E_TIMEOUT_WAITING_FOR_TOOLS:
+                    raise
+                if deadline is not None and loop.time() >= deadline:
+                    raise
+
+        self._invalidate_properties()
 
     @_blocking_job
     def install_tools(self, auto_upgrade=False, blocking=True):
@@ -1233,43 +1511,38 @@ class VixVM(VixHandle):
         return vix.VixVM_InstallTools(
             self._handle,
             ffi.cast('int', options),
-            ffi.cast('char*', 0),
-            ffi.cast('VixEventProc*', 0),
-            ffi.cast('void*', 0),
+            _NULL_CHARP,
+            _NULL_EVT,
+            _NULL_VOID,
         )
 
-    def __del__(self):
-        self.release()
+    def release(self):
+        """Releases the VM handle, subsequent calls do nothing."""
+
+        self._finalizer()
+
+_POWEROP_NORMAL = ffi.cast('VixVMPowerOpOptions', VixVM.VIX_VMPOWEROP_NORMAL)
+_POWEROP_FROM_GUEST = ffi.cast('VixVMPowerOpOptions', VixVM.VIX_VMPOWEROP_FROM_GUEST)
+_POWEROP_LAUNCH_GUI = ffi.cast('VixVMPowerOpOptions', VixVM.VIX_VMPOWEROP_LAUNCH_GUI)
+_CAPTURESCREENFORMAT_PNG = ffi.cast('int', VixVM._VIX_CAPTURESCREENFORMAT_PNG)
+
+_VIX_EVENTTYPE_JOB_COMPLETED = 2
+_VIX_EVENTTYPE_JOB_PROGRESS = 3
 
 @_backend._ffi.callback('VixEventProc')
 def _callback_handler(a, event_type, props, d):
-    from .VixHandle import VixHandle
-
-    VIX_EVENTTYPE_JOB_COMPLETED = 2
-    VIX_EVENTTYPE_JOB_PROGRESS = 3
+    if event_type == _VIX_EVENTTYPE_JOB_PROGRESS:
+        return
 
-    handle = VixHandle(a)
-    job_id = int(ffi.cast('size_t', d))
-    job = _ProcJob.by_id(job_id)
-    if not job:
-        raise ValueError('Got callback event for non-existent job')
+    waiter = ffi.from_handle(d)
 
-    if event_type == VIX_EVENTTYPE_JOB_PROGRESS:
-        pass
-    elif event_type == VIX_EVENTTYPE_JOB_COMPLETED:
-        props = handle.get_properties(
-            VixJob.VIX_PROPERTY_JOB_RESULT_PROCESS_ID,
-            VixJob.VIX_PROPERTY_JOB_RESULT_GUEST_PROGRAM_EXIT_CODE, 
-            VixJob.VIX_PROPERTY_JOB_RESULT_GUEST_PROGRAM_ELAPSED_TIME
-        )
-        if job.pid:
-            assert job.pid == props[0], 'job pid has changed'
-        job.pid = props[0]
-        job.exit_code = props[1]
-        job.elapsed_time = props[2]
-        _proc_jobs_lock.acquire(True)
-        _proc_jobs.pop(job_id)
-        _proc_jobs_lock.release()
-        job._done_evt.set()
+    if event_type == _VIX_EVENTTYPE_JOB_COMPLETED:
+        _pending_jobs.discard(waiter)
+        try:
+            waiter._completed(a)
+        finally:
+            waiter._set_done()
     else:
         raise ValueError(f"Unexpected VIX_EVENTTYPE_JOB ({event_type})")
+
+_CALLBACK = ffi.cast('VixEventProc*', _callback_handler)
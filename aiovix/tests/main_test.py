@@ -16,27 +16,43 @@ import aiovix
 # # from aiovix import VixHost, VixVM, VixSnapshot
 
 import pytest
+import pytest_asyncio
 
 
-@pytest.fixture
-async def vm():
-    host = aiovix.VixHost()
-    machine = host.open_vm("D:\\virtual machines\\windows-7-sp1-x64\\windows-7-sp1-x64.vmx")
+async def _reset_vm(machine):
     snapshot = machine.snapshot_get_named("initial install")
     await machine.snapshot_revert(snapshot)
     await machine.power_on(launch_gui=False)
-    
+
     await machine.wait_for_tools()
     await machine.login('vagrant', 'vagrant')
 
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def vm():
+    host = aiovix.VixHost()
+    machine = host.open_vm("D:\\virtual machines\\windows-7-sp1-x64\\windows-7-sp1-x64.vmx")
+    await _reset_vm(machine)
+
     yield machine
 
     if machine.power_state & machine.VIX_POWERSTATE_POWERED_ON:
         await machine.power_off()
 
 
-@pytest.mark.asyncio
-async def test_full(vm: aiovix.VixVM):
+@pytest_asyncio.fixture(loop_scope="module")
+async def clean_vm(vm):
+    """For tests that change the VM's state, reverts the shared VM afterwards."""
+
+    yield vm
+
+    await _reset_vm(vm)
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_full(clean_vm: aiovix.VixVM):
+    vm = clean_vm
+
     await vm.pause()
     assert vm.power_state & aiovix.VixVM.VIX_POWERSTATE_PAUSED, "vm should  be paused"
 
@@ -50,13 +66,37 @@ async def test_full(vm: aiovix.VixVM):
     assert not vm.power_state & aiovix.VixVM.VIX_POWERSTATE_SUSPENDED, "vm should not be suspeneded"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_guest_tools(vm: aiovix.VixVM):
     assert 'windows' in vm.guest_os
 
     assert vm.dir_exists("c:\\temp")
 
 
+@pytest.mark.asyncio(loop_scope="module")
+async def test_snapshot_walk(vm: aiovix.VixVM):
+    root = vm.snapshot_get_root()
+    snapshots = list(root.walk())
+
+    assert snapshots[0].name == root.name
+    assert len(snapshots) >= 1 + root.get_num_children()
+    for snapshot in snapshots:
+        assert isinstance(snapshot, aiovix.VixSnapshot)
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_snapshot_tree(vm: aiovix.VixVM):
+    root = vm.snapshot_get_root()
+    tree = root.materialize_tree()
+
+    assert tree.root is root
+    assert tree.get_parent(root) is None
+    assert len(tree) == len(list(root.walk()))
+    for snapshot in tree:
+        for child in tree.get_children(snapshot):
+            assert tree.get_parent(child) is snapshot
+
+
 # @pytest.fixture
 # def host():
 #     conn = aiovix.VixHost()